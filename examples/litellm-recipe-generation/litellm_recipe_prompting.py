@@ -25,6 +25,13 @@ def main():
     ]
     cuisines = Dataset.from_list(cuisines)
 
+    # Materialize the prompts up front with a batched map (one Python call per
+    # batch instead of one per row), then point the LLM at the column.
+    cuisines = cuisines.map(
+        lambda batch: {"prompt": [f"Generate a random {cuisine} recipe. Be creative but keep it realistic." for cuisine in batch["cuisine"]]},
+        batched=True,
+    )
+
     # Create prompter using LiteLLM backend
     #############################################
     # To use Gemini models:
@@ -39,7 +46,7 @@ def main():
 
     recipe_prompter = curator.LLM(
         model_name="gemini/gemini-1.5-flash",
-        prompt_func=lambda row: f"Generate a random {row['cuisine']} recipe. Be creative but keep it realistic.",
+        prompt_column="prompt",
         parse_func=lambda row, response: {
             "recipe": response,
             "cuisine": row["cuisine"],
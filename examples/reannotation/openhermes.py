@@ -2,6 +2,8 @@
 
 import logging
 
+import pyarrow as pa
+import pyarrow.compute as pc
 from datasets import load_dataset
 
 from bespokelabs import curator
@@ -11,19 +13,35 @@ logger = logging.getLogger("bespokelabs.curator")
 logger.setLevel(logging.INFO)
 
 
-def convert_row(row: dict) -> dict:
-    """Convert a conversation row from OpenHermes format to instruction/response format.
+def convert_batch(batch: dict) -> dict:
+    """Convert a batch of conversations from OpenHermes format to instruction/response format.
+
+    Uses Arrow compute kernels to flatten the nested conversation lists instead
+    of looping over rows in Python, which keeps the conversion fast even on the
+    full dataset.
 
     Args:
-        row: Dictionary containing a conversation from the OpenHermes dataset
+        batch: Batch of conversations from the OpenHermes dataset
 
     Returns:
-        Dictionary with 'instruction' and 'original_response' fields extracted from the conversation
+        Batch with 'instruction' and 'original_response' columns extracted from the conversations
     """
-    conversation = row["conversations"]
-    instruction = next((item["value"] for item in conversation if item["from"] == "human"), None)
-    response = next((item["value"] for item in conversation if item["from"] == "gpt"), None)
-    return {"instruction": instruction, "original_response": response}
+    conversations = pa.array(batch["conversations"])
+    flat = pc.list_flatten(conversations)
+    parents = pc.list_parent_indices(conversations).to_pylist()
+    speakers = pc.struct_field(flat, "from").to_pylist()
+    values = pc.struct_field(flat, "value").to_pylist()
+
+    # Scatter the flattened messages back to their rows, keeping the first
+    # message from each speaker.
+    instructions = [None] * len(batch["conversations"])
+    responses = [None] * len(batch["conversations"])
+    for parent, speaker, value in zip(parents, speakers, values):
+        if speaker == "human" and instructions[parent] is None:
+            instructions[parent] = value
+        elif speaker == "gpt" and responses[parent] is None:
+            responses[parent] = value
+    return {"instruction": instructions, "original_response": responses}
 
 
 def prompt_func(row):
@@ -58,7 +76,7 @@ distill_prompter = curator.LLM(
 
 dataset = load_dataset("teknium/OpenHermes-2.5", split="train")
 dataset = dataset.take(500)
-dataset = dataset.map(convert_row)
+dataset = dataset.map(convert_batch, batched=True, batch_size=10_000)
 dataset = dataset.select_columns(["instruction", "original_response"])
 distilled_dataset = distill_prompter(dataset)
 print(distilled_dataset)
@@ -1,6 +1,27 @@
 """BespokeLabs Curator."""
 
-from .llm.llm import LLM
-from .llm.simple_llm import SimpleLLM
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .llm.llm import LLM
+    from .llm.simple_llm import SimpleLLM
 
 __all__ = ["LLM", "SimpleLLM"]
+
+
+def __getattr__(name: str):
+    """Lazily import the public classes (PEP 562).
+
+    Importing the LLM machinery pulls in heavy dependencies (datasets, litellm,
+    etc.), so defer it until the attribute is actually accessed instead of
+    paying the cost on `import bespokelabs.curator`.
+    """
+    if name == "LLM":
+        from .llm.llm import LLM
+
+        return LLM
+    if name == "SimpleLLM":
+        from .llm.simple_llm import SimpleLLM
+
+        return SimpleLLM
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,23 @@
 """Database class for storing metadata for Bella runs."""
 
+import atexit
 import os
 import sqlite3
 
+# Number of buffered rows that triggers a flush to disk.
+_FLUSH_THRESHOLD = 64
+
 
 class MetadataDB:
-    """Database class for storing Bella run metadata."""
+    """Database class for storing Bella run metadata.
+
+    The connection is opened once per instance and kept for the lifetime of
+    the process, with relaxed synchronous mode so that writes do not fsync on
+    the critical path of every run. Rows are buffered in memory and flushed in
+    batches (and at interpreter exit).
+    """
+
+    _instances: dict = {}
 
     def __init__(self, db_path: str):
         """Initialize the MetadataDB with a given database path.
@@ -14,6 +26,54 @@ class MetadataDB:
             db_path: Path to the SQLite database file.
         """
         self.db_path = db_path
+        self._conn = None
+        self._pending = []
+
+    @classmethod
+    def get(cls, db_path: str) -> "MetadataDB":
+        """Get the shared MetadataDB instance for a given database path.
+
+        Reusing one instance per path keeps a single persistent connection
+        and write buffer per process instead of reopening the database on
+        every run.
+        """
+        if db_path not in cls._instances:
+            cls._instances[db_path] = cls(db_path)
+        return cls._instances[db_path]
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the persistent connection on first use.
+
+        Sets relaxed synchronous mode, creates the runs table if needed,
+        validates the schema, and registers a flush-and-close handler at
+        interpreter exit.
+        """
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # IMPORTANT: If you modify the CREATE TABLE schema below,
+            # you must update the expected_columns list in validate_schema()
+            # to match the new schema. Otherwise, schema validation will fail.
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_hash TEXT PRIMARY KEY,
+                    dataset_hash TEXT,
+                    prompt_func TEXT,
+                    model_name TEXT,
+                    response_format TEXT,
+                    batch_mode BOOLEAN,
+                    created_time TEXT,
+                    last_edited_time TEXT
+                )
+                """
+            )
+            conn.commit()
+            self._conn = conn
+            self.validate_schema()
+            atexit.register(self.close)
+        return self._conn
 
     def _get_current_schema(self) -> list:
         """Get the current schema of the runs table from the database.
@@ -22,11 +82,9 @@ class MetadataDB:
             list: List of tuples containing column information.
                   Each tuple contains (cid, name, type, notnull, dflt_value, pk)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(runs)")
-            schema_info = cursor.fetchall()
-        return schema_info
+        cursor = self._connection().cursor()
+        cursor.execute("PRAGMA table_info(runs)")
+        return cursor.fetchall()
 
     def validate_schema(self):
         """Validate that the current database schema matches the expected schema.
@@ -59,6 +117,10 @@ class MetadataDB:
     def store_metadata(self, metadata: dict):
         """Store metadata about a Bella run in the database.
 
+        The row is buffered in memory and written in a batch once enough rows
+        accumulate; any remaining rows are flushed at interpreter exit. Schema
+        validation still happens synchronously on the first call.
+
         Args:
             metadata: Dictionary containing run metadata with keys:
                 - timestamp: ISO format timestamp
@@ -69,29 +131,19 @@ class MetadataDB:
                 - run_hash: Unique hash identifying the run
                 - batch_mode: Boolean indicating batch mode or online mode (True = batch, False = online)
         """
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # IMPORTANT: If you modify the CREATE TABLE schema below,
-            # you must update the expected_columns list in validate_schema()
-            # to match the new schema. Otherwise, schema validation will fail.
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS runs (
-                    run_hash TEXT PRIMARY KEY,
-                    dataset_hash TEXT,
-                    prompt_func TEXT,
-                    model_name TEXT,
-                    response_format TEXT,
-                    batch_mode BOOLEAN,
-                    created_time TEXT,
-                    last_edited_time TEXT
-                )
-                """
-            )
-            self.validate_schema()
+        # Opens the connection (and validates the schema) on first use.
+        self._connection()
+        self._pending.append(metadata)
+        if len(self._pending) >= _FLUSH_THRESHOLD:
+            self.flush()
 
-            # Check if run_hash exists
+    def flush(self):
+        """Write any buffered rows to the database in a single transaction."""
+        if not self._pending:
+            return
+        conn = self._connection()
+        cursor = conn.cursor()
+        for metadata in self._pending:
             cursor.execute(
                 "SELECT run_hash FROM runs WHERE run_hash = ?",
                 (metadata["run_hash"],),
@@ -128,4 +180,12 @@ class MetadataDB:
                         "-",
                     ),
                 )
-            conn.commit()
+        conn.commit()
+        self._pending = []
+
+    def close(self):
+        """Flush buffered rows and close the connection."""
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
@@ -1,21 +1,24 @@
 """Curator: Bespoke Labs Synthetic Data Generation Library."""
 
+import functools
 import inspect
+import json
 import logging
 import os
 from datetime import datetime
 from io import BytesIO
-from typing import Any, Callable, Dict, Iterable, Optional, Type, TypeVar
+from types import CodeType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Type, TypeVar
 
 from datasets import Dataset
 from datasets.utils._dill import Pickler
 from pydantic import BaseModel
 from xxhash import xxh64
 
-from bespokelabs.curator.db import MetadataDB
 from bespokelabs.curator.llm.prompt_formatter import PromptFormatter
-from bespokelabs.curator.request_processor._factory import _RequestProcessorFactory
-from bespokelabs.curator.request_processor.config import BackendParamsType
+
+if TYPE_CHECKING:
+    from bespokelabs.curator.request_processor.config import BackendParamsType
 
 _CURATOR_DEFAULT_CACHE_DIR = "~/.cache/curator"
 T = TypeVar("T")
@@ -30,20 +33,22 @@ class LLM:
     def __init__(
         self,
         model_name: str,
-        prompt_func: Callable[[_DictOrBaseModel], _DictOrBaseModel],
+        prompt_func: Callable[[_DictOrBaseModel], _DictOrBaseModel] | None = None,
         parse_func: Callable[[_DictOrBaseModel, _DictOrBaseModel], _DictOrBaseModel] | None = None,
         response_format: Type[BaseModel] | None = None,
         batch: bool = False,
         backend: Optional[str] = None,
         generation_params: dict | None = None,
-        backend_params: BackendParamsType | None = None,
+        backend_params: Optional["BackendParamsType"] = None,
+        prompt_column: Optional[str] = None,
     ):
         """Initialize a LLM.
 
         Args:
             model_name: The name of the LLM to use
             prompt_func: A function that takes a single row
-                and returns either a string (assumed to be a user prompt) or messages list
+                and returns either a string (assumed to be a user prompt) or messages list.
+                May be omitted when prompt_column is provided
             parse_func: A function that takes the input row and
                 response object and returns the parsed output
             base_url: Optional base URL for the API endpoint
@@ -52,6 +57,9 @@ class LLM:
             batch: Whether to use batch processing
             backend: The backend to use ("openai", "litellm", or "vllm"). If None, will be auto-determined
             generation_params: Additional parameters to pass to the generation API
+            prompt_column: Name of a dataset column holding pre-materialized prompts
+                (e.g. built with a batched map); when set, prompt_func is skipped
+                entirely in the request-creation hot path
 
             backend_params: Dictionary parameters for request processing
                     - max_retries: The maximum number of retries to use for the LLM
@@ -61,6 +69,7 @@ class LLM:
                 - Online:
                     - max_requests_per_minute: Maximum number of requests per minute for rate limiting
                     - max_tokens_per_minute: Maximum number of tokens per minute for rate limiting
+                    - max_concurrent_requests: Maximum number of requests in flight at once
                     - seconds_to_pause_on_rate_limit: Number of seconds to pause when rate limited
 
                 - Batch:
@@ -75,19 +84,60 @@ class LLM:
                     - max_tokens: The maximum tokens to use for the VLLM backend
                     - gpu_memory_utilization: The GPU memory utilization to use for the VLLM backend
         """
+        # Deferred so that importing the package does not pull in the backend
+        # processors (litellm and friends) before they are needed.
+        from bespokelabs.curator.request_processor._factory import _RequestProcessorFactory
+
+        if prompt_func is None and prompt_column is None:
+            raise ValueError("Either prompt_func or prompt_column must be provided.")
+
         generation_params = generation_params or {}
-        self.prompt_formatter = PromptFormatter(model_name, prompt_func, parse_func, response_format, _remove_none_values(generation_params))
+        self.prompt_formatter = PromptFormatter(model_name, prompt_func, parse_func, response_format, _remove_none_values(generation_params), prompt_column)
         self.batch_mode = batch
 
+        # Memoized function hashes, computed lazily on the first call.
+        self._prompt_func_hash = None
+        self._parse_func_hash = None
+
+        # Canonical generation params representation, precomputed once so the
+        # fingerprint does not re-sort the dict on every call.
+        self._gen_params_canonical = tuple(sorted(self.prompt_formatter.generation_params.items()))
+
+        # Function source cache, keyed on id(func), so repeated calls do not
+        # re-read and re-tokenize the defining source file.
+        self._source_cache: Dict[int, str] = {}
+
         self._request_processor = _RequestProcessorFactory.create(
             params=backend_params, model_name=model_name, batch=batch, response_format=response_format, backend=backend, generation_params=generation_params
         )
 
+    def _cached_function_source(self, func) -> str:
+        """Get the source code of a function, memoized on the instance."""
+        key = id(func)
+        if key not in self._source_cache:
+            self._source_cache[key] = _get_function_source(func)
+        return self._source_cache[key]
+
+    def _cached_function_hash(self, func, cache_attr: str) -> str:
+        """Hash a function, memoizing the result on the instance when safe.
+
+        Functions with closures are re-hashed on every call because the captured
+        cells can change between calls (e.g. a nested helper being redefined),
+        which must invalidate the cache fingerprint. Callables without a code
+        object (partials, callable instances) are treated the same way, since
+        their captured state can also mutate between calls.
+        """
+        if func is not None and (not hasattr(func, "__code__") or func.__closure__):
+            return _get_function_hash(func)
+        if getattr(self, cache_attr) is None:
+            setattr(self, cache_attr, _get_function_hash(func))
+        return getattr(self, cache_attr)
+
     def _hash_fingerprint(self, dataset_hash, disable_cache):
         if disable_cache:
             fingerprint = xxh64(os.urandom(8)).hexdigest()
         else:
-            prompt_func_hash = _get_function_hash(self.prompt_formatter.prompt_func)
+            prompt_func_hash = self._cached_function_hash(self.prompt_formatter.prompt_func, "_prompt_func_hash")
 
             fingerprint_str = "_".join(
                 [
@@ -101,9 +151,12 @@ class LLM:
             )
 
             if self.prompt_formatter.generation_params:
-                generation_params_str = str(sorted(self.prompt_formatter.generation_params.items()))
+                generation_params_str = str(list(self._gen_params_canonical))
                 fingerprint_str += f"_{generation_params_str}"
 
+            if self.prompt_formatter.prompt_column:
+                fingerprint_str += f"_{self.prompt_formatter.prompt_column}"
+
             fingerprint = xxh64(fingerprint_str.encode("utf-8")).hexdigest()
             logger.debug(f"Curator Cache Fingerprint String: {fingerprint_str}")
             logger.debug(f"Curator Cache Fingerprint: {fingerprint}")
@@ -115,6 +168,7 @@ class LLM:
         dataset: Optional[Iterable] = None,
         working_dir: str = None,
         batch_cancel: bool = False,
+        stream: bool = False,
     ) -> Dataset:
         """Apply structured completions in parallel to a dataset using specified model and prompts.
 
@@ -122,11 +176,16 @@ class LLM:
             dataset (Iterable): A dataset consisting of a list of items to apply completions
             working_dir (str): The working directory to save the requests.jsonl, responses.jsonl, and dataset.arrow files.
             batch_cancel (bool): Whether to cancel the batch if it is running
+            stream (bool): Whether to return an IterableDataset that parses the responses lazily
+                instead of materializing the full output dataset in memory
         Returns:
             Iterable: A list of structured outputs from the completions
         """
         # We convert from iterable to Dataset because Dataset has random access via row_idx
-        if not isinstance(dataset, Dataset) and dataset is not None:
+        if isinstance(dataset, (list, tuple)):
+            # Direct Arrow table build, much lighter than the generator path.
+            dataset = Dataset.from_list(list(dataset))
+        elif not isinstance(dataset, Dataset) and dataset is not None:
             dataset = Dataset.from_generator(dataset)
 
         if working_dir is None:
@@ -137,32 +196,41 @@ class LLM:
         else:
             curator_cache_dir = working_dir
 
-        dataset_hash = dataset._fingerprint if dataset is not None else xxh64("").hexdigest()
-
         disable_cache = os.getenv("CURATOR_DISABLE_CACHE", "").lower() in ["true", "1"]
-        fingerprint = self._hash_fingerprint(dataset_hash, disable_cache)
-
-        metadata_db_path = os.path.join(curator_cache_dir, "metadata.db")
-        metadata_db = MetadataDB(metadata_db_path)
-
-        # Get the source code of the prompt function
-        prompt_func_source = _get_function_source(self.prompt_formatter.prompt_func)
-        if self.prompt_formatter.parse_func is not None:
-            parse_func_source = _get_function_source(self.prompt_formatter.parse_func)
+        if disable_cache:
+            # No cache key is needed, so skip the dataset hash, function source
+            # extraction and metadata bookkeeping entirely.
+            fingerprint = self._hash_fingerprint(None, disable_cache)
         else:
-            parse_func_source = ""
-
-        metadata_dict = {
-            "timestamp": datetime.now().isoformat(),
-            "dataset_hash": dataset_hash,
-            "prompt_func": prompt_func_source,
-            "parse_func": parse_func_source,
-            "model_name": self.prompt_formatter.model_name,
-            "response_format": (str(self.prompt_formatter.response_format.model_json_schema()) if self.prompt_formatter.response_format else "text"),
-            "run_hash": fingerprint,
-            "batch_mode": self.batch_mode,
-        }
-        metadata_db.store_metadata(metadata_dict)
+            dataset_hash = _get_dataset_hash(dataset)
+            fingerprint = self._hash_fingerprint(dataset_hash, disable_cache)
+
+            from bespokelabs.curator.db import MetadataDB
+
+            metadata_db_path = os.path.join(curator_cache_dir, "metadata.db")
+            metadata_db = MetadataDB.get(metadata_db_path)
+
+            # Get the source code of the prompt function
+            if self.prompt_formatter.prompt_func is not None:
+                prompt_func_source = self._cached_function_source(self.prompt_formatter.prompt_func)
+            else:
+                prompt_func_source = ""
+            if self.prompt_formatter.parse_func is not None:
+                parse_func_source = self._cached_function_source(self.prompt_formatter.parse_func)
+            else:
+                parse_func_source = ""
+
+            metadata_dict = {
+                "timestamp": datetime.now().isoformat(),
+                "dataset_hash": dataset_hash,
+                "prompt_func": prompt_func_source,
+                "parse_func": parse_func_source,
+                "model_name": self.prompt_formatter.model_name,
+                "response_format": (str(self.prompt_formatter.response_format.model_json_schema()) if self.prompt_formatter.response_format else "text"),
+                "run_hash": fingerprint,
+                "batch_mode": self.batch_mode,
+            }
+            metadata_db.store_metadata(metadata_dict)
 
         run_cache_dir = os.path.join(curator_cache_dir, fingerprint)
 
@@ -176,25 +244,139 @@ class LLM:
                 working_dir=run_cache_dir,
             )
         else:
-            parse_func_hash = _get_function_hash(self.prompt_formatter.parse_func)
+            parse_func_hash = self._cached_function_hash(self.prompt_formatter.parse_func, "_parse_func_hash")
             dataset = self._request_processor.run(
                 dataset=dataset,
                 working_dir=run_cache_dir,
                 parse_func_hash=parse_func_hash,
                 prompt_formatter=self.prompt_formatter,
+                stream=stream,
             )
 
         return dataset
 
+    def generate_many(
+        self,
+        datasets: Iterable[Iterable],
+        working_dir: str = None,
+    ) -> list[Dataset]:
+        """Apply completions to several datasets with one LLM instance.
+
+        Equivalent to calling the instance once per dataset, but makes the
+        amortization explicit: the function hashes, source extraction and
+        metadata database connection are all computed once on this instance
+        and reused across every run.
+
+        Args:
+            datasets (Iterable[Iterable]): The datasets to process, in order.
+            working_dir (str): The working directory to save the requests.jsonl,
+                responses.jsonl, and dataset.arrow files for each run.
+
+        Returns:
+            list[Dataset]: The processed dataset for each input, in order.
+        """
+        return [self(dataset, working_dir=working_dir) for dataset in datasets]
+
+
+def _update_code_hash(code: CodeType, hasher) -> None:
+    """Stream the path-independent fields of a code object into the hasher.
+
+    Deliberately excludes co_filename and co_firstlineno so that identical
+    functions defined in different files produce the same hash. Nested code
+    objects (e.g. inner lambdas) are recursed into rather than repr'd, since
+    their repr contains the file path and memory address.
+    """
+    hasher.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_code_hash(const, hasher)
+        else:
+            hasher.update(repr(const).encode())
+    for name in sorted(code.co_names):
+        hasher.update(name.encode())
+    for name in code.co_varnames:
+        hasher.update(name.encode())
+    for name in code.co_freevars:
+        hasher.update(name.encode())
+    for name in code.co_cellvars:
+        hasher.update(name.encode())
+
+
+def _update_function_hash(func, hasher, visited: set) -> None:
+    """Stream a function's code, defaults and closure into the hasher.
+
+    Closure cells holding functions are recursed into so that redefining a
+    captured helper changes the hash. A visited set guards against cycles
+    (e.g. a recursive closure capturing itself).
+    """
+    if id(func) in visited:
+        return
+    visited.add(id(func))
+
+    if isinstance(func, functools.partial):
+        hasher.update(repr(func.args).encode())
+        hasher.update(repr(func.keywords).encode())
+        _update_function_hash(func.func, hasher, visited)
+        return
+    if not hasattr(func, "__code__"):
+        # Callable instance or builtin: the streaming path only understands
+        # plain functions, so fall back to pickling the whole object.
+        file = BytesIO()
+        Pickler(file, recurse=True).dump(func)
+        hasher.update(file.getvalue())
+        return
+
+    _update_code_hash(func.__code__, hasher)
+    hasher.update(repr(func.__defaults__).encode())
+    hasher.update(repr(func.__kwdefaults__).encode())
+    if func.__closure__:
+        for cell in func.__closure__:
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                # Empty cell (not yet bound)
+                hasher.update(b"<empty cell>")
+                continue
+            if callable(contents) and hasattr(contents, "__code__"):
+                _update_function_hash(contents, hasher, visited)
+            else:
+                hasher.update(repr(contents).encode())
+
 
 def _get_function_hash(func) -> str:
-    """Get a hash of a function's source code."""
+    """Get a hash of a function's bytecode and captured state.
+
+    Streams the relevant code object fields directly into a single xxh64
+    digest, which avoids the dill/pickle overhead of serializing the whole
+    function object just to produce a cache key.
+    """
     if func is None:
         return xxh64("").hexdigest()
 
-    file = BytesIO()
-    Pickler(file, recurse=True).dump(func)
-    return xxh64(file.getvalue()).hexdigest()
+    hasher = xxh64()
+    _update_function_hash(func, hasher, set())
+    return hasher.hexdigest()
+
+
+def _get_dataset_hash(dataset: Optional[Dataset]) -> str:
+    """Get the hash of a dataset used in the cache fingerprint.
+
+    Normally this is the dataset's own Arrow fingerprint. For very large
+    datasets that fingerprint can be O(N) to compute (e.g. after
+    from_generator), so when CURATOR_FAST_FINGERPRINT is set we hash the
+    length plus the first and last rows instead — O(1), with a collision
+    risk acceptable for a cache key that is already probabilistic.
+    """
+    if dataset is None:
+        return xxh64("").hexdigest()
+    fast_fingerprint = os.getenv("CURATOR_FAST_FINGERPRINT", "").lower() in ["true", "1"]
+    if fast_fingerprint and len(dataset) > 1_000_000:
+        hasher = xxh64()
+        hasher.update(str(len(dataset)).encode())
+        hasher.update(json.dumps(dataset[0], default=str, sort_keys=True).encode())
+        hasher.update(json.dumps(dataset[-1], default=str, sort_keys=True).encode())
+        return hasher.hexdigest()
+    return dataset._fingerprint
 
 
 def _get_function_source(func) -> str:
@@ -50,13 +50,24 @@ class PromptFormatter:
         parse_func: Optional function to parse model responses
         response_format: Optional Pydantic model defining expected response format
         generation_params: Dictionary of parameters for generation
+        prompt_column: Optional name of a dataset column holding pre-materialized
+            prompts; when set, prompt_func is not called
     """
 
     model_name: str
-    prompt_func: Callable[[_DictOrBaseModel], Dict[str, str]]
+    prompt_func: Optional[Callable[[_DictOrBaseModel], Dict[str, str]]] = None
     parse_func: Optional[Callable[[_DictOrBaseModel, _DictOrBaseModel], T]] = None
     response_format: Optional[Type[BaseModel]] = None
     generation_params: dict = field(default_factory=dict)
+    prompt_column: Optional[str] = None
+
+    def __post_init__(self):
+        """Initialize the cached prompt_func arity.
+
+        Computed lazily on first use so that arity errors still surface at
+        request-creation time rather than at construction.
+        """
+        self._prompt_func_n_params: Optional[int] = None
 
     def create_generic_request(self, row: _DictOrBaseModel, idx: int) -> GenericRequest:
         """Format the request object based off of `LLM` attributes.
@@ -71,13 +82,22 @@ class PromptFormatter:
         Raises:
             ValueError: If prompt_func has invalid number of arguments or returns invalid format
         """
-        sig = inspect.signature(self.prompt_func)
-        if len(sig.parameters) == 0:
-            prompts = self.prompt_func()
-        elif len(sig.parameters) == 1:
-            prompts = self.prompt_func(row)
+        if self.prompt_column is not None:
+            # Pre-materialized prompts: read the column instead of calling
+            # prompt_func per row.
+            prompts = row[self.prompt_column]
         else:
-            raise ValueError(f"Prompting function {self.prompt_func} must have 0 or 1 arguments.")
+            # Inspecting the signature is surprisingly expensive, so do it once
+            # and reuse the cached arity for every subsequent row.
+            if self._prompt_func_n_params is None:
+                self._prompt_func_n_params = len(inspect.signature(self.prompt_func).parameters)
+
+            if self._prompt_func_n_params == 0:
+                prompts = self.prompt_func()
+            elif self._prompt_func_n_params == 1:
+                prompts = self.prompt_func(row)
+            else:
+                raise ValueError(f"Prompting function {self.prompt_func} must have 0 or 1 arguments.")
 
         if isinstance(prompts, str):
             messages = [{"role": "user", "content": prompts}]
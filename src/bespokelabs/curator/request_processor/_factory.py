@@ -1,4 +1,5 @@
 import logging
+import re
 import typing as t
 
 from pydantic import BaseModel
@@ -13,6 +14,9 @@ from bespokelabs.curator.request_processor.config import (
 
 logger = logging.getLogger(__name__)
 
+# Model names that route to the OpenAI backend when no response format is set.
+_OPENAI_MODEL_RE = re.compile(r"gpt-|o1-preview|o1-mini")
+
 if t.TYPE_CHECKING:
     from pydantic import BaseModel
 
@@ -36,10 +40,11 @@ class _RequestProcessorFactory:
 
     @staticmethod
     def _check_openai_structured_output_support(config_params) -> bool:
-        from bespokelabs.curator.request_processor.online.openai_online_request_processor import OpenAIOnlineRequestProcessor
+        from bespokelabs.curator.request_processor.online.openai_online_request_processor import _model_supports_structured_output
 
-        config = OnlineRequestProcessorConfig(**_remove_none_values(config_params))
-        return OpenAIOnlineRequestProcessor(config).check_structured_output_support()
+        # Pure model-name check; instantiating a full request processor here
+        # would probe the API for rate limits on every LLM construction.
+        return _model_supports_structured_output(config_params["model"])
 
     @staticmethod
     def _determine_backend(
@@ -57,7 +62,7 @@ class _RequestProcessorFactory:
             return "openai"
 
         # GPT models and O1 models without response format should use OpenAI
-        if not response_format and any(x in model_name for x in ["gpt-", "o1-preview", "o1-mini"]):
+        if not response_format and _OPENAI_MODEL_RE.search(model_name):
             logger.info(f"Requesting text output from {model_name}, using OpenAI backend")
             return "openai"
 
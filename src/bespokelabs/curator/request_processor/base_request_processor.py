@@ -12,7 +12,7 @@ from typing import List, Optional
 
 import aiofiles
 import pyarrow
-from datasets import Dataset
+from datasets import Dataset, IterableDataset
 from datasets.arrow_writer import ArrowWriter
 from pydantic import BaseModel, ValidationError
 
@@ -26,6 +26,9 @@ logger = logging.getLogger(__name__)
 
 CACHE_MSG = "If you want to regenerate the dataset, disable or delete the cache."
 
+# Number of serialized request lines accumulated before each write call.
+_REQUEST_WRITE_CHUNK = 1000
+
 
 class BaseRequestProcessor(ABC):
     """Base class for all request processors.
@@ -79,6 +82,7 @@ class BaseRequestProcessor(ABC):
         working_dir: str,
         parse_func_hash: str,
         prompt_formatter: PromptFormatter,
+        stream: bool = False,
     ) -> Dataset:
         """Uses the API to completing the specific map by calling the LLM.
 
@@ -87,6 +91,8 @@ class BaseRequestProcessor(ABC):
             working_dir: Working directory to save files (requests.jsonl, responses.jsonl, dataset.arrow)
             parse_func_hash: Hash of the parse function for caching
             prompt_formatter: Formatter for generating prompts from dataset rows
+            stream: If True, return an IterableDataset that parses responses
+                lazily instead of materializing the full Arrow table
 
         Returns:
             Dataset: Completed dataset with LLM responses
@@ -98,10 +104,12 @@ class BaseRequestProcessor(ABC):
         self.working_dir = working_dir
         self.total_requests = len(dataset) if dataset is not None else 1
 
-        # load from already completed dataset
-        output_dataset = self.attempt_loading_cached_dataset(parse_func_hash)
-        if output_dataset is not None:
-            return output_dataset
+        # load from already completed dataset (streaming reads the response
+        # files directly, so it skips the materialized Arrow cache)
+        if not stream:
+            output_dataset = self.attempt_loading_cached_dataset(parse_func_hash)
+            if output_dataset is not None:
+                return output_dataset
 
         logger.info(f"Running {self.__class__.__name__} completions with model: {self.config.model}")
 
@@ -113,6 +121,8 @@ class BaseRequestProcessor(ABC):
 
         self.requests_to_responses(generic_request_files)
 
+        if stream:
+            return self.stream_dataset()
         return self.create_dataset_files(parse_func_hash)
 
     def _verify_existing_request_files(self, dataset: Optional[Dataset]) -> List[int]:
@@ -263,12 +273,20 @@ class BaseRequestProcessor(ABC):
             end_idx = len(dataset)
 
         async with aiofiles.open(request_file, "w") as f:
+            # Buffer serialized lines and write them in chunks so large batches
+            # do not pay one write call (and event-loop hop) per request.
+            buffer = []
             for idx, dataset_row in enumerate(dataset):
                 dataset_row_idx = idx + start_idx
                 # Get the generic request from the map function
                 request = self.prompt_formatter.create_generic_request(dataset_row, dataset_row_idx)
                 request.generation_params = self.config.generation_params
-                await f.write(json.dumps(request.model_dump(), default=str) + "\n")
+                buffer.append(json.dumps(request.model_dump(), default=str) + "\n")
+                if len(buffer) >= _REQUEST_WRITE_CHUNK:
+                    await f.write("".join(buffer))
+                    buffer.clear()
+            if buffer:
+                await f.write("".join(buffer))
 
         num_requests = end_idx - start_idx
         metadata_dict = {"num_jobs": num_requests}
@@ -300,6 +318,63 @@ class BaseRequestProcessor(ABC):
                     "Deleted file and attempting to regenerate dataset from cached LLM responses."
                 )
 
+    def stream_dataset(self) -> IterableDataset:
+        """Stream processed responses as an IterableDataset.
+
+        Lighter sibling of create_dataset_files: rows are parsed lazily while
+        the consumer iterates, so peak memory stays at one response at a time
+        and no dataset cache file is written. Failed or unparseable responses
+        are skipped.
+
+        Returns:
+            IterableDataset yielding the parsed rows
+
+        Raises:
+            ValueError: If no responses files are found
+        """
+        responses_files = sorted(glob.glob(os.path.join(self.working_dir, "responses_*.jsonl")))
+        if len(responses_files) == 0:
+            raise ValueError(f"No responses files found in {self.working_dir}")
+
+        def response_rows():
+            for responses_file in responses_files:
+                with open(responses_file, "r") as f_in:
+                    for generic_response_string in f_in:
+                        response = GenericResponse.model_validate_json(generic_response_string)
+
+                        if response.response_errors is not None:
+                            continue
+
+                        try:
+                            response.response_message = self.prompt_formatter.response_to_response_format(response.response_message)
+                        except (json.JSONDecodeError, ValidationError):
+                            logger.warning("Skipping response due to error parsing response message into response format")
+                            continue
+
+                        # parse_func can return a single row or a list of rows
+                        if self.prompt_formatter.parse_func:
+                            dataset_rows = self.prompt_formatter.parse_func(
+                                response.generic_request.original_row,
+                                response.response_message,
+                            )
+                            if not isinstance(dataset_rows, list):
+                                dataset_rows = [dataset_rows]
+                        else:
+                            # Convert response to dict before adding to dataset
+                            response_value = response.response_message
+                            if hasattr(response_value, "model_dump"):
+                                response_value = response_value.model_dump()
+                            elif hasattr(response_value, "__dict__"):
+                                response_value = response_value.__dict__
+                            dataset_rows = [{"response": response_value}]
+
+                        for row in dataset_rows:
+                            if isinstance(row, BaseModel):
+                                row = row.model_dump()
+                            yield row
+
+        return IterableDataset.from_generator(response_rows)
+
     def create_dataset_files(
         self,
         parse_func_hash: str,
@@ -1,8 +1,12 @@
+import json
 import logging
+import os
+from typing import Iterable, Iterator
 
+import httpx
 import instructor
 import litellm
-from anthropic import AsyncAnthropic
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 from anthropic.types.messages import MessageBatch, MessageBatchRequestCounts
 from anthropic.types.shared.not_found_error import NotFoundError
 
@@ -15,6 +19,16 @@ from bespokelabs.curator.types.token_usage import TokenUsage
 
 logger = logging.getLogger(__name__)
 
+# Maps Anthropic processing statuses to generic batch statuses. The API uses
+# "canceling" (one l); the British spelling is kept for compatibility with
+# trackers written before this was corrected.
+_STATUS_MAP = {
+    "canceling": GenericBatchStatus.SUBMITTED,
+    "cancelling": GenericBatchStatus.SUBMITTED,
+    "in_progress": GenericBatchStatus.SUBMITTED,
+    "ended": GenericBatchStatus.FINISHED,
+}
+
 
 class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
     """Anthropic-specific implementation of the BatchRequestProcessor.
@@ -35,11 +49,44 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
     def __init__(self, config: BatchRequestProcessorConfig) -> None:
         """Initialize the AnthropicBatchRequestProcessor."""
         super().__init__(config)
+        # Connection pool sized to the batch-operation concurrency limit, so
+        # the semaphore's worth of in-flight operations reuse keep-alive
+        # connections instead of contending for httpx's smaller defaults.
+        # DefaultAsyncHttpxClient keeps the SDK's default timeouts.
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=self.max_concurrent_batch_operations,
+                max_keepalive_connections=self.max_concurrent_batch_operations,
+            ),
+        )
         if self.config.base_url is None:
-            self.client = AsyncAnthropic(max_retries=self.config.max_retries)
+            self.client = AsyncAnthropic(max_retries=self.config.max_retries, http_client=http_client)
         else:
-            self.client = AsyncAnthropic(max_retries=self.config.max_retries, base_url=self.config.base_url)
+            self.client = AsyncAnthropic(max_retries=self.config.max_retries, base_url=self.config.base_url, http_client=http_client)
         self.web_dashboard = "https://console.anthropic.com/settings/workspaces/default/batches"
+        # Computed once: the suffix is stamped onto every parsed batch object.
+        # The client constructs with api_key=None when the env var is unset;
+        # let the SDK raise its auth error at request time in that case.
+        self._api_key_suffix = (self.client.api_key or "")[-4:]
+
+        # Per-token prices looked up once; completion_cost would re-tokenize
+        # the prompt and completion on every response even though the API
+        # already reports exact token counts.
+        model_pricing = litellm.model_cost.get(self.config.model, {})
+        self._input_cost_per_token = model_pricing.get("input_cost_per_token")
+        self._output_cost_per_token = model_pricing.get("output_cost_per_token")
+
+        # Constant for the processor's lifetime; looking it up per request
+        # would repeat litellm's model-name normalization in the batch
+        # construction loop.
+        self._max_tokens = litellm.get_max_tokens(self.config.model)
+
+        # Request params that are identical for every request in a batch,
+        # merged into each per-request params dict instead of rebuilt N times.
+        self._request_params_template = {
+            "model": self.config.model,
+            "max_tokens": self._max_tokens,
+        }
 
     @property
     def backend(self):
@@ -136,11 +183,8 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
         Raises:
             ValueError: If the batch status is unknown.
         """
-        if batch.processing_status in ["cancelling", "in_progress"]:
-            status = GenericBatchStatus.SUBMITTED
-        elif batch.processing_status in ["ended"]:
-            status = GenericBatchStatus.FINISHED
-        else:
+        status = _STATUS_MAP.get(batch.processing_status)
+        if status is None:
             raise ValueError(f"Unknown batch status: {batch.processing_status}")
 
         return GenericBatch(
@@ -149,9 +193,12 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
             created_at=batch.created_at,
             finished_at=batch.ended_at,
             status=status,
-            api_key_suffix=self.client.api_key[-4:],
+            api_key_suffix=self._api_key_suffix,
             request_counts=self.parse_api_specific_request_counts(batch.request_counts),
-            raw_batch=batch.model_dump(),
+            # Compact JSON text instead of a nested dict tree: cheaper to keep
+            # in the tracker for the job's lifetime, and re-validation can take
+            # pydantic-core's JSON fast path.
+            raw_batch=batch.model_dump_json(),
             raw_status=batch.processing_status,
         )
 
@@ -170,17 +217,21 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
             dict: API specific request body formatted for Anthropic's batch API,
                 including custom_id and request parameters.
         """
-        _, kwargs = instructor.handle_response_model(
-            self.prompt_formatter.response_format,  # Use the object instead of the dict
-            mode=instructor.Mode.ANTHROPIC_JSON,
-            messages=generic_request.messages,
-        )
+        if self.prompt_formatter.response_format is not None:
+            _, kwargs = instructor.handle_response_model(
+                self.prompt_formatter.response_format,  # Use the object instead of the dict
+                mode=instructor.Mode.ANTHROPIC_JSON,
+                messages=generic_request.messages,
+            )
+        else:
+            # Without a response format instructor would hand the kwargs back
+            # unchanged, so skip the call entirely in the per-request loop.
+            kwargs = {"messages": generic_request.messages}
 
         return {
             "custom_id": str(generic_request.original_row_idx),
             "params": {
-                "model": generic_request.model,
-                "max_tokens": litellm.get_max_tokens(self.config.model),
+                **self._request_params_template,  # contains 'model' and 'max_tokens'
                 **kwargs,  # contains 'system' and 'messages'
                 **generic_request.generation_params,  # contains 'temperature', 'top_p', etc.
             },
@@ -217,19 +268,31 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
             response_body = raw_response["result"]["message"]
             response_message_raw = response_body["content"][0]["text"]
             usage = response_body.get("usage", {})
-
-            token_usage = TokenUsage(
-                prompt_tokens=usage.get("input_tokens", 0),
-                completion_tokens=usage.get("output_tokens", 0),
-                total_tokens=usage.get("input_tokens", 0) + usage.get("output_tokens", 0),
+            input_tokens = usage.get("input_tokens", 0)
+            output_tokens = usage.get("output_tokens", 0)
+
+            # model_construct skips validation; the token counts come straight
+            # from the API and are already ints.
+            token_usage = TokenUsage.model_construct(
+                prompt_tokens=input_tokens,
+                completion_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
             )
             response_message, response_errors = self.prompt_formatter.parse_response_message(response_message_raw)
 
-            cost = litellm.completion_cost(
-                model=self.config.model,
-                prompt=str(generic_request.messages),
-                completion=response_message_raw,
-            )
+            if self._input_cost_per_token is not None and self._output_cost_per_token is not None:
+                cost = input_tokens * self._input_cost_per_token + output_tokens * self._output_cost_per_token
+            elif input_tokens == 0 and output_tokens == 0:
+                # Deduplicated clone: the representative carries the billing.
+                cost = 0.0
+            else:
+                # Unknown model: fall back to litellm's estimate, which
+                # re-tokenizes the prompt and completion.
+                cost = litellm.completion_cost(
+                    model=self.config.model,
+                    prompt=str(generic_request.messages),
+                    completion=response_message_raw,
+                )
             cost *= 0.5  # 50% off for batch
         elif result_type == "errored":
             error = raw_response["result"]["error"]
@@ -241,7 +304,9 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
         else:
             raise ValueError(f"Unknown result type: {result_type}")
 
-        return GenericResponse(
+        # Every field is produced above from already-validated data, so the
+        # per-response validation pass in this hot loop is pure overhead.
+        return GenericResponse.model_construct(
             response_message=response_message,
             response_errors=response_errors,
             raw_response=raw_response,
@@ -256,6 +321,11 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
     async def submit_batch(self, requests: list[dict], metadata: dict) -> GenericBatch:
         """Handles the complete batch submission process.
 
+        Identical requests within the batch are submitted only once: one
+        representative per unique params is sent, and the duplicates are
+        recorded on the batch's dedup_map so download_batch can fan the
+        representative's response back out to every original custom_id.
+
         Args:
             requests (list[dict]): List of API-specific requests to submit
             metadata (dict): Metadata to be included with the batch
@@ -266,9 +336,28 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
         Side Effects:
             - Updates tracker with submitted batch status
         """
+        unique_requests = []
+        representative_by_hash = {}
+        dedup_map = {}
+        for request in requests:
+            request_hash = json.dumps(request["params"], sort_keys=True, default=str)
+            representative = representative_by_hash.get(request_hash)
+            if representative is None:
+                representative_by_hash[request_hash] = request["custom_id"]
+                unique_requests.append(request)
+            else:
+                dedup_map.setdefault(representative, []).append(request["custom_id"])
+
+        if dedup_map:
+            n_duplicates = sum(len(ids) for ids in dedup_map.values())
+            logger.info(f"Deduplicated {n_duplicates} identical requests before submission ({len(unique_requests)} unique).")
+
         async with self.semaphore:
-            batch = await self.client.messages.batches.create(requests=requests)
-            return self.parse_api_specific_batch_object(batch, request_file=metadata["request_file"])
+            batch = await self.client.messages.batches.create(requests=unique_requests)
+            generic_batch = self.parse_api_specific_batch_object(batch, request_file=metadata["request_file"])
+            if dedup_map:
+                generic_batch.dedup_map = dedup_map
+            return generic_batch
 
     async def retrieve_batch(self, batch: GenericBatch) -> GenericBatch:
         """Retrieves the current status of a batch from Anthropic's API.
@@ -287,33 +376,91 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
             try:
                 batch = await self.client.messages.batches.retrieve(batch.id)
             except NotFoundError:
-                logger.warning(f"batch object {batch.id} not found. " f"Your API key (***{self.client.api_key[-4:]}) might not have access to this batch.")
+                logger.warning(f"batch object {batch.id} not found. " f"Your API key (***{self._api_key_suffix}) might not have access to this batch.")
                 return None
 
             request_file = self.tracker.submitted_batches[batch.id].request_file
             return self.parse_api_specific_batch_object(batch, request_file=request_file)
 
-    async def download_batch(self, batch: GenericBatch) -> list[dict] | None:
+    async def download_batch(self, batch: GenericBatch) -> Iterable[dict] | None:
         """Downloads the results of a completed batch.
 
         Args:
             batch: The batch object to download results for.
 
         Returns:
-            list[dict]: List of response dictionaries.
+            Iterable[dict]: Lazy iterator of response dictionaries, read from
+                the on-disk results file one line at a time so a batch's
+                responses are never all held in memory.
             None: If download fails.
 
         Side Effects:
-            - Streams results from Anthropic's API.
-            - Converts each result to a dictionary format.
+            - Streams results from Anthropic's API into an on-disk results
+              file, which is reused on later runs since ended batches are
+              immutable.
+            - Fans responses of deduplicated requests back out to every
+              original custom_id recorded in the batch's dedup_map.
+        """
+        results_file = os.path.join(self.working_dir, f"batch_results_{batch.id}.jsonl")
+        if not os.path.exists(results_file):
+            await self._download_results_file(batch, results_file)
+        return self._iter_responses(batch, results_file)
+
+    async def _download_results_file(self, batch: GenericBatch, results_file: str) -> None:
+        """Stream a batch's raw results JSONL from the API to results_file.
+
+        Writes to a temporary file and renames it into place on completion,
+        so an interrupted download is never mistaken for a cached result.
         """
         async with self.semaphore:
-            MessageBatch.model_validate(batch.raw_batch)
-            responses = []
+            # Trackers written before raw_batch became JSON text store a dict.
+            if isinstance(batch.raw_batch, str):
+                MessageBatch.model_validate_json(batch.raw_batch)
+            else:
+                MessageBatch.model_validate(batch.raw_batch)
             results_stream = await self.client.messages.batches.results(batch.id)
-            async for result in results_stream:
-                responses.append(result.model_dump())
-            return responses
+            tmp_file = results_file + ".tmp"
+            # Write the JSONL byte stream directly: the SDK decoder would
+            # json-parse each line and build a typed model only for us to dump
+            # it straight back out again.
+            with open(tmp_file, "wb") as f:
+                async for chunk in results_stream.http_response.aiter_bytes():
+                    f.write(chunk)
+            await results_stream.close()
+            os.replace(tmp_file, results_file)
+            logger.debug(f"Batch {batch.id} results cached at {results_file}")
+
+    @staticmethod
+    def _iter_responses(batch: GenericBatch, results_file: str) -> Iterator[dict]:
+        """Yield responses from a results file, cloning deduplicated custom_ids.
+
+        Parsing happens lazily as the consumer iterates, so downstream writing
+        of the response file provides natural backpressure.
+        """
+        with open(results_file, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                raw_response = json.loads(line)
+                yield raw_response
+                if batch.dedup_map:
+                    for duplicate_custom_id in batch.dedup_map.get(raw_response["custom_id"], []):
+                        yield AnthropicBatchRequestProcessor._clone_response(raw_response, duplicate_custom_id)
+
+    @staticmethod
+    def _clone_response(raw_response: dict, custom_id: str) -> dict:
+        """Clone a response for a deduplicated custom_id with zeroed usage.
+
+        The API bills the representative request once; carrying its token
+        usage onto every duplicate would multiply the tracked token and cost
+        totals by the duplication factor.
+        """
+        clone = {**raw_response, "custom_id": custom_id}
+        result = raw_response["result"]
+        if result.get("type") == "succeeded":
+            message = {**result["message"], "usage": {"input_tokens": 0, "output_tokens": 0}}
+            clone["result"] = {**result, "message": message}
+        return clone
 
     async def cancel_batch(self, batch: GenericBatch) -> GenericBatch:
         """Cancels a running batch job.
@@ -330,19 +477,16 @@ class AnthropicBatchRequestProcessor(BaseBatchRequestProcessor):
             - Updates batch status in generic format.
 
         Note:
-            Cannot cancel already ended batches.
+            The cancel endpoint is the single source of truth: it returns the
+            updated batch object on success, and errors for batches that have
+            already ended, so no preflight status retrieval is needed.
         """
         async with self.semaphore:
             request_file = self.tracker.submitted_batches[batch.id].request_file
-            batch_object = await self.retrieve_batch(batch)
-            if batch_object.status == "ended":
-                logger.warning(f"Batch {batch.id} is already ended, cannot cancel")
-                return self.parse_api_specific_batch_object(batch_object, request_file=request_file)
             try:
-                await self.client.messages.batches.cancel(batch.id)
-                logger.info(f"Successfully cancelled batch: {batch.id}")
-                return self.parse_api_specific_batch_object(batch_object, request_file=request_file)
+                batch_object = await self.client.messages.batches.cancel(batch.id)
             except Exception as e:
-                error_msg = str(e)
-                logger.error(f"Failed to cancel batch {batch.id}: {error_msg}")
-                return self.parse_api_specific_batch_object(batch_object, request_file=request_file)
+                logger.error(f"Failed to cancel batch {batch.id}: {e}")
+                return batch
+            logger.info(f"Successfully cancelled batch: {batch.id}")
+            return self.parse_api_specific_batch_object(batch_object, request_file=request_file)
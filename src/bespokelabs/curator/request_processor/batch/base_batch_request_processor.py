@@ -3,11 +3,12 @@ import json
 import logging
 import os
 from abc import abstractmethod
-from typing import Optional
+from typing import Iterable, Optional
 
 from litellm import model_cost
 
 from bespokelabs.curator.request_processor.base_request_processor import BaseRequestProcessor
+from bespokelabs.curator.request_processor.batch.response_cache import ResponseCache
 from bespokelabs.curator.request_processor.config import BatchRequestProcessorConfig
 from bespokelabs.curator.request_processor.event_loop import run_in_event_loop
 from bespokelabs.curator.status_tracker.batch_status_tracker import BatchStatusTracker
@@ -53,6 +54,7 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
         """
         super().__init__(config)
         self._tracker_console = None  # Add this line to store console for testing
+        self._response_cache = ResponseCache.from_env()
 
     @property
     def backend(self) -> str:
@@ -334,8 +336,9 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
                 f"Preventing batch submission. Please reduce `batch_size`."
             )
 
-        # Join requests with newlines and encode to bytes for upload
-        file_content = "\n".join(json.dumps(r) for r in api_specific_requests).encode()
+        # Join requests with newlines and encode to bytes for upload. Compact
+        # separators keep the serialization (and the uploaded payload) smaller.
+        file_content = "\n".join(json.dumps(r, separators=(",", ":")) for r in api_specific_requests).encode()
         file_content_size = len(file_content)
         logger.debug(f"Batch file content size: {file_content_size / (1024 * 1024):.2f} MB ({file_content_size:,} bytes)")
         if file_content_size > self.max_bytes_per_batch:
@@ -368,12 +371,90 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
             - Updates batch objects file
         """
         metadata = {"request_file": request_file}
+        if self._response_cache is not None:
+            completed_request_ids = completed_request_ids | self._write_cached_responses(request_file, completed_request_ids)
         requests = self.requests_from_generic_request_file(request_file, completed_request_ids)
-        batch = await self.submit_batch(requests, metadata)
+        if len(requests) == 0:
+            logger.info(f"All requests in {request_file} were served from the response cache, nothing to submit.")
+            self.tracker.unsubmitted_request_files.discard(request_file)
+            await self.update_batch_objects_file()
+            return
 
-        self.tracker.mark_as_submitted(batch, len(requests))
+        request_chunks = self._chunk_by_max_bytes(requests)
+        if len(request_chunks) > 1:
+            logger.info(f"Splitting {request_file} into {len(request_chunks)} batches to stay under {self.max_bytes_per_batch:,} bytes per batch.")
+        for i, request_chunk in enumerate(request_chunks):
+            batch = await self.submit_batch(request_chunk, metadata)
+            n_submitted = len(request_chunk)
+            if batch.dedup_map:
+                # Deduplicated requests were never sent to the API; counting
+                # them as submitted would skew the tracker's request totals.
+                n_submitted -= sum(len(ids) for ids in batch.dedup_map.values())
+            if i > 0:
+                # mark_as_submitted pops the request file from the unsubmitted
+                # set; put it back so follow-up chunks of the same file are not
+                # logged as re-submissions.
+                self.tracker.unsubmitted_request_files.add(request_file)
+            self.tracker.mark_as_submitted(batch, n_submitted)
         await self.update_batch_objects_file()
 
+    def _chunk_by_max_bytes(self, requests: list[dict]) -> list[list[dict]]:
+        """Pack requests into chunks that fit within max_bytes_per_batch.
+
+        Sizes are measured on the compact JSONL serialization of each request
+        as it is packed, so oversized request files are split into multiple
+        batches instead of being rejected by the API. A single chunk (the
+        common case) leaves submission behavior unchanged.
+        """
+        chunks = [[]]
+        cumulative_bytes = 0
+        for request in requests:
+            size = len(json.dumps(request, separators=(",", ":")).encode()) + 1
+            if chunks[-1] and cumulative_bytes + size > self.max_bytes_per_batch:
+                chunks.append([])
+                cumulative_bytes = 0
+            chunks[-1].append(request)
+            cumulative_bytes += size
+        return chunks
+
+    def _write_cached_responses(self, request_file: str, completed_request_ids: set[int]) -> set[int]:
+        """Write cached responses for a request file and return their row indices.
+
+        Looks up every not-yet-completed request in the response cache; hits
+        are appended to the corresponding response file (with the current
+        generic request patched in and zero cost) so they are excluded from
+        batch submission.
+
+        Args:
+            request_file: Path to the file containing generic requests.
+            completed_request_ids: Row indices that already have responses.
+
+        Returns:
+            set[int]: Row indices that were served from the cache.
+        """
+        response_file = request_file.replace("requests_", "responses_")
+        cached_ids = set()
+        cached_lines = []
+
+        with open(request_file, "r") as f:
+            for line in f:
+                generic_request = GenericRequest.model_validate_json(line)
+                if generic_request.original_row_idx in completed_request_ids:
+                    continue
+                cached_response = self._response_cache.get(ResponseCache.request_hash(generic_request))
+                if cached_response is None:
+                    continue
+                cached_response["generic_request"] = generic_request.model_dump()
+                cached_response["response_cost"] = 0.0
+                cached_lines.append(json.dumps(cached_response, default=str) + "\n")
+                cached_ids.add(generic_request.original_row_idx)
+
+        if cached_lines:
+            with open(response_file, "a") as f:
+                f.write("".join(cached_lines))
+            logger.info(f"Reused {len(cached_ids)} cached responses for {request_file}")
+        return cached_ids
+
     def requests_from_generic_request_file(self, request_file: str, completed_request_ids: set[int]) -> list[dict]:
         """Reads and converts generic requests from a file into API-specific request format.
 
@@ -398,15 +479,17 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
 
         return api_specific_requests
 
-    def generic_response_file_from_responses(self, responses: list[dict], batch: GenericBatch) -> str | None:
+    def generic_response_file_from_responses(self, responses: Iterable[dict], batch: GenericBatch) -> str | None:
         """Process API responses and create generic response file.
 
         Converts API-specific responses to GenericResponse objects and writes them
         to a response file. Handles successful and failed responses, including
-        token usage tracking and cost calculation.
+        token usage tracking and cost calculation. Responses are parsed and
+        written in a single pass against a request map built once up front, so
+        producers may hand in a lazy iterable rather than a materialized list.
 
         Args:
-            responses: List of raw API response dictionaries.
+            responses: Iterable of raw API response dictionaries.
             batch: Batch object containing request metadata.
 
         Returns:
@@ -437,13 +520,17 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
         total_cost = 0.0
 
         # appending allows for the resubmitted resumed batch
+        cache_entries = []
         with open(response_file, "a") as f:
             for raw_response in responses:
                 request_idx = int(raw_response["custom_id"])
                 generic_request = generic_request_map[request_idx]
                 generic_response = self.parse_api_specific_response(raw_response, generic_request, batch)
-                json.dump(generic_response.model_dump(), f, default=str)
-                f.write("\n")
+                serialized_response = json.dumps(generic_response.model_dump(), default=str)
+                f.write(serialized_response + "\n")
+
+                if self._response_cache is not None and generic_response.response_errors is None:
+                    cache_entries.append((ResponseCache.request_hash(generic_request), serialized_response))
 
                 # Update token and cost totals
                 if generic_response.token_usage:
@@ -455,6 +542,8 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
 
         # Update tracker with token usage and cost stats
         self.tracker.update_token_and_cost(total_token_usage, total_cost)
+        if self._response_cache is not None:
+            self._response_cache.put_many(cache_entries)
         return response_file
 
     async def submit_batches_from_request_files(
@@ -515,25 +604,27 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
             - Logs batch status and request counts
             - Marks completed batches as finished
         """
-        async with self.semaphore:
-            batch = await self.retrieve_batch(batch)
-            if batch is not None:
-                self.tracker.update_submitted(batch)
-
-                n_succeeded_requests = batch.request_counts.succeeded
-                n_failed_requests = batch.request_counts.failed
-                n_total_requests = batch.request_counts.total
-
-                logger.debug(
-                    f"Batch {batch.id} status: {batch.raw_status} requests: "
-                    f"{n_succeeded_requests}/{n_failed_requests}/{n_total_requests} "
-                    "succeeded/failed/total"
-                )
+        # retrieve_batch acquires self.semaphore itself; taking it here as
+        # well would hold two permits per status check and halve the poll
+        # fan-out across in-flight batches.
+        batch = await self.retrieve_batch(batch)
+        if batch is not None:
+            self.tracker.update_submitted(batch)
+
+            n_succeeded_requests = batch.request_counts.succeeded
+            n_failed_requests = batch.request_counts.failed
+            n_total_requests = batch.request_counts.total
+
+            logger.debug(
+                f"Batch {batch.id} status: {batch.raw_status} requests: "
+                f"{n_succeeded_requests}/{n_failed_requests}/{n_total_requests} "
+                "succeeded/failed/total"
+            )
 
-                if batch.status == GenericBatchStatus.FINISHED:
-                    logger.debug(f"Batch {batch.id} finished with status: {batch.raw_status}")
-                    self.tracker.mark_as_finished(batch)
-                    await self.update_batch_objects_file()
+            if batch.status == GenericBatchStatus.FINISHED:
+                logger.debug(f"Batch {batch.id} finished with status: {batch.raw_status}")
+                self.tracker.mark_as_finished(batch)
+                await self.update_batch_objects_file()
 
     async def poll_and_process_batches(self) -> None:
         """Monitor and process batches until completion.
@@ -557,6 +648,13 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
         """
         # loop until all batches have been returned
         all_response_files = []
+        # Exponential backoff on idle polls: long-running batches do not need
+        # to be re-checked every batch_check_interval, so the sleep doubles on
+        # each round without progress (up to 8x) and resets as soon as a batch
+        # finishes, downloads, or completes more requests.
+        max_check_interval = self.config.batch_check_interval * 8
+        check_interval = self.config.batch_check_interval
+        last_progress = None
         while self.tracker.n_submitted_batches + self.tracker.n_finished_batches > 0:
             # check batch status also updates the tracker
             status_tasks = [self.check_batch_status(batch) for batch in self.tracker.submitted_batches.values()]
@@ -574,11 +672,22 @@ class BaseBatchRequestProcessor(BaseRequestProcessor):
 
             self.tracker.update_display()
             if self.tracker.n_submitted_batches + self.tracker.n_finished_batches > 0:
-                logger.debug(f"Sleeping for {self.config.batch_check_interval} seconds...")
-                await asyncio.sleep(self.config.batch_check_interval)
+                progress = (
+                    self.tracker.n_finished_or_downloaded_batches,
+                    self.tracker.n_finished_or_downloaded_succeeded_requests,
+                )
+                if progress == last_progress:
+                    check_interval = min(check_interval * 2, max_check_interval)
+                else:
+                    check_interval = self.config.batch_check_interval
+                last_progress = progress
+                logger.debug(f"Sleeping for {check_interval} seconds...")
+                await asyncio.sleep(check_interval)
 
         response_files = filter(None, all_response_files)
-        if self.tracker.n_downloaded_batches == 0 or not response_files:
+        # n_total_batches == 0 means every request was served from the
+        # response cache and nothing was ever submitted.
+        if self.tracker.n_total_batches > 0 and (self.tracker.n_downloaded_batches == 0 or not response_files):
             raise RuntimeError(f"None of the submitted batches completed successfully. Please check the logs above and {self.web_dashboard} for errors.")
 
     async def download_batch_to_response_file(self, batch: GenericBatch) -> str | None:
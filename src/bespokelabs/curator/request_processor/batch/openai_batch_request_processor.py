@@ -301,12 +301,13 @@ class OpenAIBatchRequestProcessor(BaseBatchRequestProcessor, OpenAIRequestMixin)
             - Logs warnings if batch is not found or inaccessible
             - Uses API key suffix to help identify access issues
         """
-        try:
-            batch = await self.client.batches.retrieve(batch.id)
-        except NotFoundError:
-            logger.warning(f"batch object {batch.id} not found. " f"Your API key (***{self.client.api_key[-4:]}) might not have access to this batch.")
-            return None
-        return self.parse_api_specific_batch_object(batch)
+        async with self.semaphore:
+            try:
+                batch = await self.client.batches.retrieve(batch.id)
+            except NotFoundError:
+                logger.warning(f"batch object {batch.id} not found. " f"Your API key (***{self.client.api_key[-4:]}) might not have access to this batch.")
+                return None
+            return self.parse_api_specific_batch_object(batch)
 
     async def delete_file(self, file_id: str, semaphore: asyncio.Semaphore):
         """Deletes a file from OpenAI's storage.
@@ -413,11 +414,14 @@ class OpenAIBatchRequestProcessor(BaseBatchRequestProcessor, OpenAIRequestMixin)
             - Logs success or failure of cancellation
             - Retrieves current batch status before attempting cancellation
         """
+        # retrieve_batch acquires the semaphore itself; holding it here as
+        # well would deadlock once every permit is taken by concurrent
+        # cancel_batch tasks waiting on the nested acquire.
+        batch_object = await self.retrieve_batch(batch)
+        if batch_object.status == "completed":
+            logger.warning(f"Batch {batch.id} is already completed, cannot cancel")
+            return 0
         async with self.semaphore:
-            batch_object = await self.retrieve_batch(batch)
-            if batch_object.status == "completed":
-                logger.warning(f"Batch {batch.id} is already completed, cannot cancel")
-                return 0
             try:
                 await self.client.batches.cancel(batch.id)
                 logger.info(f"Successfully cancelled batch: {batch.id}")
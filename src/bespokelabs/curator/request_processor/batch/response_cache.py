@@ -0,0 +1,91 @@
+"""Persistent exact-match response cache for batch request processors."""
+
+import json
+import logging
+import os
+import sqlite3
+from typing import Optional
+
+from xxhash import xxh64
+
+from bespokelabs.curator.types.generic_request import GenericRequest
+
+logger = logging.getLogger(__name__)
+
+_RESPONSE_CACHE_DIR_ENV = "CURATOR_RESPONSE_CACHE_DIR"
+
+
+class ResponseCache:
+    """Exact-match cache of responses keyed by a hash of the request.
+
+    Stores serialized GenericResponse objects in a SQLite table keyed by a
+    hash of (model, messages, generation_params). Batch processors consult it
+    before submission so duplicate prompts across runs are answered from disk
+    instead of being re-sent to the API.
+
+    Enabled by setting the CURATOR_RESPONSE_CACHE_DIR environment variable to
+    the directory that should hold the cache database.
+    """
+
+    def __init__(self, db_path: str):
+        """Initialize the cache with a given database path.
+
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (hash TEXT PRIMARY KEY, response TEXT)")
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """Create a cache from the environment, or None when not configured."""
+        cache_dir = os.getenv(_RESPONSE_CACHE_DIR_ENV)
+        if not cache_dir:
+            return None
+        db_path = os.path.join(os.path.expanduser(cache_dir), "response_cache.db")
+        logger.info(f"Using response cache at {db_path}")
+        return cls(db_path)
+
+    @staticmethod
+    def request_hash(generic_request: GenericRequest) -> str:
+        """Compute the cache key for a generic request.
+
+        Hashes the fields that determine the model output: model name,
+        messages, and generation params.
+        """
+        key = json.dumps(
+            {
+                "model": generic_request.model,
+                "messages": generic_request.messages,
+                "generation_params": generic_request.generation_params,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return xxh64(key.encode()).hexdigest()
+
+    def get(self, request_hash: str) -> Optional[dict]:
+        """Look up a cached response by request hash.
+
+        Returns:
+            The stored GenericResponse as a dict, or None on a miss.
+        """
+        row = self._conn.execute("SELECT response FROM cache WHERE hash = ?", (request_hash,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put_many(self, entries: list[tuple[str, str]]):
+        """Store serialized responses in a single transaction.
+
+        Args:
+            entries: List of (request_hash, serialized_response) tuples.
+        """
+        if not entries:
+            return
+        self._conn.executemany("INSERT OR REPLACE INTO cache (hash, response) VALUES (?, ?)", entries)
+        self._conn.commit()
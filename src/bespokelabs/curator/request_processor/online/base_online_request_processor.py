@@ -71,6 +71,10 @@ class BaseOnlineRequestProcessor(BaseRequestProcessor, ABC):
         self.header_based_max_requests_per_minute = None
         self.header_based_max_tokens_per_minute = None
 
+        # Optional cap on the number of requests in flight at once, enforced
+        # with a semaphore created per processing run.
+        self._request_semaphore = None
+
         # The rich.Console used for the status tracker, only set for testing
         self._tracker_console = None
 
@@ -218,6 +222,9 @@ class BaseOnlineRequestProcessor(BaseRequestProcessor, ABC):
         status_tracker.max_requests_per_minute = self.max_requests_per_minute
         status_tracker.max_tokens_per_minute = self.max_tokens_per_minute
 
+        if self.config.max_concurrent_requests:
+            self._request_semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+
         # Resume if a response file exists
         completed_request_ids = self.validate_existing_response_file(response_file)
 
@@ -251,7 +258,7 @@ class BaseOnlineRequestProcessor(BaseRequestProcessor, ABC):
 
                     # Wait for capacity if needed
                     while not status_tracker.has_capacity(token_estimate):
-                        await asyncio.sleep(0.1)
+                        await asyncio.sleep(status_tracker.seconds_until_capacity(token_estimate))
 
                     # Wait for rate limits cool down if needed
                     await self.cool_down_if_rate_limit_error(status_tracker)
@@ -293,7 +300,7 @@ class BaseOnlineRequestProcessor(BaseRequestProcessor, ABC):
 
                     # Wait for capacity if needed
                     while not status_tracker.has_capacity(token_estimate):
-                        await asyncio.sleep(0.1)
+                        await asyncio.sleep(status_tracker.seconds_until_capacity(token_estimate))
 
                     # Consume capacity before making request
                     status_tracker.consume_capacity(token_estimate)
@@ -343,11 +350,19 @@ class BaseOnlineRequestProcessor(BaseRequestProcessor, ABC):
             status_tracker: Tracks request status
         """
         try:
-            generic_response = await self.call_single_request(
-                request=request,
-                session=session,
-                status_tracker=status_tracker,
-            )
+            if self._request_semaphore is not None:
+                async with self._request_semaphore:
+                    generic_response = await self.call_single_request(
+                        request=request,
+                        session=session,
+                        status_tracker=status_tracker,
+                    )
+            else:
+                generic_response = await self.call_single_request(
+                    request=request,
+                    session=session,
+                    status_tracker=status_tracker,
+                )
             status_tracker.update_stats(generic_response.token_usage, generic_response.response_cost)
 
             # Allows us to retry on responses that don't match the response format
@@ -2,6 +2,7 @@ import datetime
 import logging
 import os
 import time
+from functools import lru_cache
 from typing import TypeVar
 
 import aiohttp
@@ -22,6 +23,47 @@ logger = logger = logging.getLogger(__name__)
 _DEFAULT_OPENAI_URL: str = "https://api.openai.com/v1/chat/completions"
 
 
+@lru_cache(maxsize=None)
+def _model_supports_structured_output(model_name: str) -> bool:
+    """Check if a model supports structured output based on model name and date.
+
+    Pure string/date logic, so the result is cached per model name and the
+    check can be used (e.g. by the backend factory) without instantiating a
+    request processor.
+
+    Returns:
+        bool: True if model supports structured output, False otherwise
+
+    Note:
+        Supports:
+        - gpt-4o-mini with date >= 2024-07-18 or latest
+        - gpt-4o with date >= 2024-08-06 or latest
+    """
+    model_name = model_name.lower()
+
+    # Check gpt-4o-mini support
+    if model_name == "gpt-4o-mini":  # Latest version
+        return True
+    if "gpt-4o-mini-" in model_name:
+        mini_date = datetime.datetime.strptime(model_name.split("gpt-4o-mini-")[1], "%Y-%m-%d")
+        if mini_date >= datetime.datetime(2024, 7, 18):
+            return True
+
+    # Check gpt-4o and o1 support
+    if model_name in ["gpt-4o", "o1"]:  # Latest version
+        return True
+    if "gpt-4o-" in model_name:
+        base_date = datetime.datetime.strptime(model_name.split("gpt-4o-")[1], "%Y-%m-%d")
+        if base_date >= datetime.datetime(2024, 8, 6):
+            return True
+    if "o1-" in model_name:
+        base_date = datetime.datetime.strptime(model_name.split("o1-")[1], "%Y-%m-%d")
+        if base_date >= datetime.datetime(2024, 12, 17):  # Support o1 dated versions from 2024-12-17
+            return True
+
+    return False
+
+
 class OpenAIOnlineRequestProcessor(BaseOnlineRequestProcessor, OpenAIRequestMixin):
     """OpenAI-specific implementation of the OnlineRequestProcessor.
 
@@ -133,35 +175,8 @@ class OpenAIOnlineRequestProcessor(BaseOnlineRequestProcessor, OpenAIRequestMixi
 
         Returns:
             bool: True if model supports structured output, False otherwise
-
-        Note:
-            Supports:
-            - gpt-4o-mini with date >= 2024-07-18 or latest
-            - gpt-4o with date >= 2024-08-06 or latest
         """
-        model_name = self.config.model.lower()
-
-        # Check gpt-4o-mini support
-        if model_name == "gpt-4o-mini":  # Latest version
-            return True
-        if "gpt-4o-mini-" in model_name:
-            mini_date = datetime.datetime.strptime(model_name.split("gpt-4o-mini-")[1], "%Y-%m-%d")
-            if mini_date >= datetime(2024, 7, 18):
-                return True
-
-        # Check gpt-4o and o1 support
-        if model_name in ["gpt-4o", "o1"]:  # Latest version
-            return True
-        if "gpt-4o-" in model_name:
-            base_date = datetime.datetime.strptime(model_name.split("gpt-4o-")[1], "%Y-%m-%d")
-            if base_date >= datetime.datetime(2024, 8, 6):
-                return True
-        if "o1-" in model_name:
-            base_date = datetime.datetime.strptime(model_name.split("o1-")[1], "%Y-%m-%d")
-            if base_date >= datetime.datetime(2024, 12, 17):  # Support o1 dated versions from 2024-12-17
-                return True
-
-        return False
+        return _model_supports_structured_output(self.config.model)
 
     def create_api_specific_request_online(self, generic_request: GenericRequest) -> dict:
         """Create an OpenAI-specific request from a generic request.
@@ -271,7 +271,9 @@ class OnlineStatusTracker:
         """Check if there's enough capacity for a request."""
         self.update_capacity()
         has_capacity = self.available_request_capacity >= 1 and self.available_token_capacity >= token_estimate
-        if not has_capacity:
+        # This runs on every dispatch attempt, so don't build the log string
+        # unless debug logging is actually on.
+        if not has_capacity and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"No capacity for request with {token_estimate} tokens. "
                 f"Available capacity: {int(self.available_token_capacity)} tokens, "
@@ -279,6 +281,24 @@ class OnlineStatusTracker:
             )
         return has_capacity
 
+    def seconds_until_capacity(self, token_estimate: int) -> float:
+        """Estimate how long until there is capacity for a request.
+
+        Computes the time needed for the leaky buckets to refill enough for one
+        request with the given token estimate, so callers can sleep for the
+        right duration instead of polling on a fixed interval. Clamped to a
+        small minimum since other in-flight tasks also consume capacity.
+        """
+        seconds_needed = 0.0
+        if self.max_requests_per_minute > 0 and self.available_request_capacity < 1:
+            seconds_needed = (1 - self.available_request_capacity) * 60.0 / self.max_requests_per_minute
+        if self.max_tokens_per_minute > 0 and self.available_token_capacity < token_estimate:
+            seconds_needed = max(
+                seconds_needed,
+                (token_estimate - self.available_token_capacity) * 60.0 / self.max_tokens_per_minute,
+            )
+        return max(seconds_needed, 0.01)
+
     def consume_capacity(self, token_estimate: int):
         """Consume capacity for a request."""
         self.available_request_capacity -= 1
@@ -2,7 +2,7 @@
 
 import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 from pydantic import BaseModel
 
@@ -35,4 +35,9 @@ class GenericBatch(BaseModel):
     api_key_suffix: str  # Last few characters of the API key used
     request_counts: GenericBatchRequestCounts  # Statistics about the requests
     raw_status: str  # Raw status string from the API
-    raw_batch: dict  # Complete raw batch data from the API
+    # Complete raw batch data from the API, either as a dict or as compact
+    # JSON text (cheaper to retain and to re-validate)
+    raw_batch: Union[dict, str]
+    # Maps a submitted custom_id to the custom_ids of identical requests that
+    # were deduplicated away before submission, if the backend deduplicates
+    dedup_map: Optional[dict[str, list[str]]] = None
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from bespokelabs.curator.request_processor.batch.anthropic_batch_request_processor import AnthropicBatchRequestProcessor
+from bespokelabs.curator.request_processor.config import BatchRequestProcessorConfig
+from bespokelabs.curator.types.generic_batch import GenericBatch
+
+# json.dumps({"custom_id": <one char>}, separators=(",", ":")) is 17 bytes,
+# plus the newline accounted for per JSONL line.
+_REQUEST_BYTES = 18
+
+
+class _SmallBatchProcessor(AnthropicBatchRequestProcessor):
+    """Processor with a tiny byte cap so chunk boundaries are testable."""
+
+    @property
+    def max_bytes_per_batch(self) -> int:
+        return 3 * _REQUEST_BYTES
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test-key")
+    return _SmallBatchProcessor(BatchRequestProcessorConfig(model="claude-3-5-sonnet-20240620"))
+
+
+def _requests(n):
+    return [{"custom_id": str(i)} for i in range(n)]
+
+
+def test_chunk_by_max_bytes_single_chunk(processor):
+    """Tests that requests fitting exactly within the cap stay in one chunk."""
+    requests = _requests(3)
+    assert processor._chunk_by_max_bytes(requests) == [requests]
+
+
+def test_chunk_by_max_bytes_rolls_over_at_boundary(processor):
+    """Tests that the first request past the cap starts a new chunk, in order."""
+    requests = _requests(7)
+    chunks = processor._chunk_by_max_bytes(requests)
+    assert chunks == [requests[0:3], requests[3:6], requests[6:7]]
+
+
+def test_chunk_by_max_bytes_oversized_request_gets_own_chunk(processor):
+    """Tests that a single request over the cap is still emitted as its own chunk."""
+    oversized = {"custom_id": "x" * (4 * _REQUEST_BYTES)}
+    requests = [*_requests(1), oversized, *_requests(1)]
+    chunks = processor._chunk_by_max_bytes(requests)
+    assert chunks == [[requests[0]], [oversized], [requests[2]]]
+    assert len(json.dumps(oversized, separators=(",", ":"))) > processor.max_bytes_per_batch
+
+
+def _results_file(tmp_path, raw_responses):
+    results_file = tmp_path / "batch_results_test.jsonl"
+    results_file.write_text("".join(json.dumps(r) + "\n" for r in raw_responses))
+    return str(results_file)
+
+
+def _succeeded_response(custom_id, input_tokens=10, output_tokens=5):
+    return {
+        "custom_id": custom_id,
+        "result": {
+            "type": "succeeded",
+            "message": {
+                "content": [{"text": "hi"}],
+                "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+            },
+        },
+    }
+
+
+def test_iter_responses_dedup_fan_out_ordering(tmp_path):
+    """Tests that duplicate clones follow their representative, then the next response."""
+    batch = GenericBatch.model_construct(dedup_map={"0": ["2", "3"]})
+    results_file = _results_file(tmp_path, [_succeeded_response("0"), _succeeded_response("1")])
+
+    responses = list(AnthropicBatchRequestProcessor._iter_responses(batch, results_file))
+    assert [r["custom_id"] for r in responses] == ["0", "2", "3", "1"]
+
+
+def test_iter_responses_clones_have_zeroed_usage(tmp_path):
+    """Tests that fan-out clones do not repeat the representative's token usage."""
+    batch = GenericBatch.model_construct(dedup_map={"0": ["1"]})
+    results_file = _results_file(tmp_path, [_succeeded_response("0")])
+
+    representative, clone = AnthropicBatchRequestProcessor._iter_responses(batch, results_file)
+    assert representative["result"]["message"]["usage"] == {"input_tokens": 10, "output_tokens": 5}
+    assert clone["result"]["message"]["usage"] == {"input_tokens": 0, "output_tokens": 0}
+    assert clone["result"]["message"]["content"] == representative["result"]["message"]["content"]
+
+
+def test_iter_responses_without_dedup_map(tmp_path):
+    """Tests that responses pass through untouched when nothing was deduplicated."""
+    batch = GenericBatch.model_construct(dedup_map=None)
+    raw_responses = [_succeeded_response("0"), _succeeded_response("1")]
+    results_file = _results_file(tmp_path, raw_responses)
+
+    assert list(AnthropicBatchRequestProcessor._iter_responses(batch, results_file)) == raw_responses
@@ -73,6 +73,28 @@ def test_prompt_formatter_create_generic_request():
     assert request.original_row_idx == 1
 
 
+def test_prompt_formatter_prompt_column():
+    """Tests that prompt_column reads pre-materialized prompts instead of calling prompt_func."""
+    formatter = PromptFormatter(model_name="test-model", prompt_column="prompt")
+    request = formatter.create_generic_request({"prompt": "Hello"}, 0)
+    assert request.messages == [{"role": "user", "content": "Hello"}]
+    assert request.original_row == {"prompt": "Hello"}
+
+    # Message lists from the column are validated like prompt_func return values
+    request = formatter.create_generic_request({"prompt": [{"role": "system", "content": "You are helpful"}, {"role": "user", "content": "Hi"}]}, 1)
+    assert len(request.messages) == 2
+    with pytest.raises(ValueError, match="must be one of: assistant, system, user"):
+        formatter.create_generic_request({"prompt": [{"role": "invalid", "content": "Hi"}]}, 2)
+
+    # prompt_func is not called when prompt_column is set
+    def _explode(row):
+        raise AssertionError("prompt_func should not be called")
+
+    formatter = PromptFormatter(model_name="test-model", prompt_func=_explode, prompt_column="prompt")
+    request = formatter.create_generic_request({"prompt": "from column"}, 3)
+    assert request.messages == [{"role": "user", "content": "from column"}]
+
+
 def test_prompt_formatter_invalid_prompt_func():
     """Tests that PromptFormatter raises errors for invalid prompt functions."""
     # Test prompt function with too many parameters
@@ -0,0 +1,57 @@
+import json
+
+from bespokelabs.curator.request_processor.batch.response_cache import ResponseCache
+from bespokelabs.curator.types.generic_request import GenericRequest
+
+
+def _generic_request(content="Hello", model="test-model", generation_params=None):
+    return GenericRequest(
+        model=model,
+        messages=[{"role": "user", "content": content}],
+        original_row={"prompt": content},
+        original_row_idx=0,
+        generation_params=generation_params or {},
+    )
+
+
+def test_request_hash_is_stable_and_discriminating():
+    """Tests that the cache key depends on model, messages and generation params only."""
+    request = _generic_request()
+    assert ResponseCache.request_hash(request) == ResponseCache.request_hash(_generic_request())
+
+    # The original row index is not part of the key: identical prompts at
+    # different dataset positions share a cache entry.
+    other_idx = _generic_request()
+    other_idx.original_row_idx = 7
+    assert ResponseCache.request_hash(request) == ResponseCache.request_hash(other_idx)
+
+    assert ResponseCache.request_hash(request) != ResponseCache.request_hash(_generic_request(content="Goodbye"))
+    assert ResponseCache.request_hash(request) != ResponseCache.request_hash(_generic_request(model="other-model"))
+    assert ResponseCache.request_hash(request) != ResponseCache.request_hash(_generic_request(generation_params={"temperature": 0.5}))
+
+
+def test_put_many_get_round_trip(tmp_path):
+    """Tests that stored responses come back as the dict that was serialized."""
+    cache = ResponseCache(str(tmp_path / "response_cache.db"))
+    request_hash = ResponseCache.request_hash(_generic_request())
+    response = {"response_message": "hi", "response_errors": None}
+
+    assert cache.get(request_hash) is None
+    cache.put_many([(request_hash, json.dumps(response))])
+    assert cache.get(request_hash) == response
+
+    # put_many upserts: a newer response for the same hash replaces the old one
+    updated = {"response_message": "hi again", "response_errors": None}
+    cache.put_many([(request_hash, json.dumps(updated))])
+    assert cache.get(request_hash) == updated
+
+
+def test_from_env_gating(tmp_path, monkeypatch):
+    """Tests that the cache is only created when its env var is set."""
+    monkeypatch.delenv("CURATOR_RESPONSE_CACHE_DIR", raising=False)
+    assert ResponseCache.from_env() is None
+
+    monkeypatch.setenv("CURATOR_RESPONSE_CACHE_DIR", str(tmp_path))
+    cache = ResponseCache.from_env()
+    assert cache is not None
+    assert cache.db_path == str(tmp_path / "response_cache.db")